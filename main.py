@@ -1,14 +1,22 @@
 import csv
 import datetime as dt
+import math
 import os
+import queue
 import sqlite3
 import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from tkinter import filedialog, messagebox, ttk
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "space.db")
+SEARCH_DEBOUNCE_MS = 150
+REFRESH_DEBOUNCE_MS = 200
+DB_POLL_MS = 50
+WRITE_BATCH_MS = 50
+_ARABIC_DIGITS = str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
 
-<<<<<<< HEAD
 COLORS = {
     "primary": "#1E1E2F",
     "secondary": "#FFD700",
@@ -22,16 +30,75 @@ COLORS = {
     "accent_yellow": "#f6c90e",
 }
 
-=======
->>>>>>> main
+STATE_COLORS = {
+    "Active": COLORS["accent_green"],
+    "Paused": COLORS["accent_yellow"],
+    "Stopped": COLORS["accent_red"],
+}
+
+
+class Station:
+    __slots__ = ("name", "type", "rate_per_hour", "rate_per_sec", "rate_var", "customer_var", "last_values")
+
+    def __init__(self, name, station_type, rate_per_hour):
+        self.name = name
+        self.type = station_type
+        self.rate_per_hour = rate_per_hour
+        self.rate_per_sec = rate_per_hour / 3600
+        self.rate_var = None
+        self.customer_var = None
+        self.last_values = None
+
+
 STATIONS = [
-    {"name": "Table 1", "type": "table", "rate_per_hour": 60.0},
-    {"name": "Table 2", "type": "table", "rate_per_hour": 60.0},
-    {"name": "Table 3", "type": "table", "rate_per_hour": 60.0},
-    {"name": "PlayStation 1", "type": "ps", "rate_per_hour": 40.0},
-    {"name": "PlayStation 2", "type": "ps", "rate_per_hour": 40.0},
+    Station("Table 1", "table", 60.0),
+    Station("Table 2", "table", 60.0),
+    Station("Table 3", "table", 60.0),
+    Station("PlayStation 1", "ps", 40.0),
+    Station("PlayStation 2", "ps", 40.0),
 ]
 
+# Per-connection settings; journal_mode=WAL is persistent and set in init_db().
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+SELECT_ITEMS_SQL = "SELECT id, name, price FROM items ORDER BY name"
+SEARCH_ITEMS_SQL = "SELECT id, name, price FROM items WHERE py_lower(name) LIKE ? ESCAPE '\\' ORDER BY name"
+SELECT_ITEM_SQL = "SELECT name, price FROM items WHERE id = ?"
+INSERT_ITEM_SQL = "INSERT INTO items (name, price) VALUES (?, ?)"
+UPDATE_ITEM_SQL = "UPDATE items SET name = ?, price = ? WHERE id = ?"
+DELETE_ITEM_SQL = "DELETE FROM items WHERE id = ?"
+INSERT_SALE_SQL = "INSERT INTO item_sales (ts, item_id, qty, total) VALUES (?, ?, ?, ?)"
+INSERT_CASH_SQL = "INSERT INTO cash_transactions (ts, type, amount, notes) VALUES (?, ?, ?, ?)"
+SELECT_CASH_SQL = "SELECT id, type, amount, notes, ts FROM cash_transactions ORDER BY ts DESC"
+SEARCH_CASH_SQL = (
+    "SELECT id, type, amount, notes, ts FROM cash_transactions"
+    " WHERE py_lower(type || ' ' || COALESCE(notes, '') || ' ' || ts) LIKE ? ESCAPE '\\'"
+    " ORDER BY ts DESC"
+)
+INSERT_SESSION_SQL = """
+    INSERT INTO sessions (station_name, customer_name, start_ts, end_ts, duration_seconds, rate_per_hour, cost)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+REPORT_TOTALS_SQL = """
+    SELECT
+        (SELECT COALESCE(SUM(cost), 0) FROM sessions WHERE start_ts BETWEEN ? AND ?),
+        (SELECT COALESCE(SUM(total), 0) FROM item_sales WHERE ts BETWEEN ? AND ?),
+        (SELECT COALESCE(SUM(CASE WHEN type = 'deposit' THEN amount ELSE -amount END), 0)
+            FROM cash_transactions WHERE ts BETWEEN ? AND ?)
+"""
+EXPORT_TOTALS_SQL = """
+    SELECT
+        (SELECT COALESCE(SUM(cost), 0) FROM sessions),
+        (SELECT COALESCE(SUM(total), 0) FROM item_sales),
+        (SELECT COALESCE(SUM(CASE WHEN type = 'deposit' THEN amount ELSE -amount END), 0) FROM cash_transactions)
+"""
+EXPORT_CASH_SQL = "SELECT ts, type, amount, notes FROM cash_transactions ORDER BY ts"
+
 
 def init_db():
     with sqlite3.connect(DB_PATH) as conn:
@@ -81,6 +148,75 @@ def init_db():
             )
             """
         )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_start_ts ON sessions(start_ts)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_item_sales_ts ON item_sales(ts)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cash_tx_ts ON cash_transactions(ts)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_items_name ON items(name)")
+        conn.execute("PRAGMA journal_mode=WAL")
+
+
+def connect_db():
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    # SQLite's LOWER() only folds ASCII; searches lowercase with Python so "Éclair" matches "éclair".
+    conn.create_function("py_lower", 1, str.lower, deterministic=True)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def fetch_items(conn, search_term):
+    if search_term:
+        return conn.execute(SEARCH_ITEMS_SQL, (like_pattern(search_term),)).fetchall()
+    return conn.execute(SELECT_ITEMS_SQL).fetchall()
+
+
+def fetch_cash(conn, search_term):
+    if search_term:
+        return conn.execute(SEARCH_CASH_SQL, (like_pattern(search_term),)).fetchall()
+    return conn.execute(SELECT_CASH_SQL).fetchall()
+
+
+def fetch_report_totals(conn, start_iso, end_iso):
+    return tuple(conn.execute(REPORT_TOTALS_SQL, (start_iso, end_iso) * 3).fetchone())
+
+
+def write_batch(conn, writes):
+    # Each write runs in its own savepoint, so a failing row is rolled back without losing the rest of the batch.
+    failed = []
+    with conn:
+        conn.execute("BEGIN")
+        for index, (sql, params) in enumerate(writes):
+            conn.execute("SAVEPOINT batch_write")
+            try:
+                conn.execute(sql, params)
+            except sqlite3.Error as exc:
+                conn.execute("ROLLBACK TO batch_write")
+                failed.append((index, exc))
+            conn.execute("RELEASE batch_write")
+    return failed
+
+
+def write_export(conn, path):
+    with open(path, "w", newline="", buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        # Read everything inside one transaction so totals and detail rows come from the same snapshot.
+        conn.execute("BEGIN")
+        try:
+            sessions_total, sales_total, cash_total = conn.execute(EXPORT_TOTALS_SQL).fetchone()
+            writer.writerow(["Section", "Amount (EGP)"])
+            writer.writerow(["Sessions", f"{sessions_total:.2f}"])
+            writer.writerow(["Item Sales", f"{sales_total:.2f}"])
+            writer.writerow(["Cash Net", f"{cash_total:.2f}"])
+            writer.writerow([])
+            writer.writerow(["Time", "Type", "Amount (EGP)", "Notes"])
+            writer.writerows(
+                (ts, tx_type, f"{amount:.2f}", notes)
+                for ts, tx_type, amount, notes in conn.execute(EXPORT_CASH_SQL)
+            )
+        finally:
+            conn.commit()
+    return path
 
 
 def format_currency(amount, rtl=False):
@@ -90,16 +226,31 @@ def format_currency(amount, rtl=False):
     return formatted
 
 
+@lru_cache(maxsize=4096)
+def format_cents(cents, rtl=False):
+    # A running station's cost changes by a cent or more every tick, so hits come from the rate column and idle stations.
+    return format_currency(cents / 100, rtl)
+
+
+def format_duration(seconds):
+    hours, rest = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
 def to_arabic_numerals(text):
-    arabic_digits = str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
-    return text.translate(arabic_digits)
+    return text.translate(_ARABIC_DIGITS)
 
 
 def now_iso():
     return dt.datetime.now().isoformat(timespec="seconds")
 
 
-<<<<<<< HEAD
+def like_pattern(term):
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
 class ToolTip:
     def __init__(self, widget, text):
         self.widget = widget
@@ -133,8 +284,6 @@ class ToolTip:
             self.tip = None
 
 
-=======
->>>>>>> main
 class StationState:
     def __init__(self, station, on_update):
         self.station = station
@@ -142,6 +291,7 @@ class StationState:
         self.running = False
         self.paused = False
         self.start_ts = None
+        self.started_at = None
         self.elapsed = 0
         self.customer_name = ""
 
@@ -150,17 +300,19 @@ class StationState:
             return
         self.running = True
         self.paused = False
-        self.start_ts = time.time()
+        self.start_ts = time.monotonic()
+        if self.started_at is None:
+            self.started_at = now_iso()
         self.on_update()
 
     def pause(self):
         if not self.running:
             return
         if not self.paused:
-            self.elapsed += time.time() - self.start_ts
+            self.elapsed += time.monotonic() - self.start_ts
             self.paused = True
         else:
-            self.start_ts = time.time()
+            self.start_ts = time.monotonic()
             self.paused = False
         self.on_update()
 
@@ -168,7 +320,7 @@ class StationState:
         if not self.running:
             return
         if not self.paused:
-            self.elapsed += time.time() - self.start_ts
+            self.elapsed += time.monotonic() - self.start_ts
         self.running = False
         self.paused = False
         self.on_update()
@@ -177,13 +329,14 @@ class StationState:
         self.running = False
         self.paused = False
         self.start_ts = None
+        self.started_at = None
         self.elapsed = 0
         self.customer_name = ""
         self.on_update()
 
     def current_elapsed(self):
         if self.running and not self.paused:
-            return self.elapsed + (time.time() - self.start_ts)
+            return self.elapsed + (time.monotonic() - self.start_ts)
         return self.elapsed
 
 
@@ -195,15 +348,116 @@ class SpaceApp:
         self.rtl = tk.BooleanVar(value=False)
         self.status_var = tk.StringVar(value="Ready")
         self.station_states = {}
+        self._selected_station = None
+        self._dash = []
+        self._item_search_after = None
+        self._cash_search_after = None
+        self._items_cache = {}
+        self._cash_cache = {}
+        self._tick_armed = False
+        self._rtl_refresh_pending = False
+        self._report_refresh_pending = False
+        self.conn = connect_db()
+        # Reads run on a single worker thread with its own connection; WAL lets it read while self.conn writes.
+        self._worker_conn = connect_db()
+        self._db_executor = ThreadPoolExecutor(max_workers=1)
+        self._db_results = queue.SimpleQueue()
+        self._db_pending = 0
+        self._db_polling = False
+        self._pending_writes = []
+        self._write_callbacks = {}
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self._setup_style()
         self._build_ui()
-        self._refresh_items()
-        self._refresh_cash()
         self._schedule_tick()
 
+    def _on_close(self):
+        if self._pending_writes:
+            self._flush_writes()
+        self._db_executor.shutdown(wait=True)
+        self._worker_conn.close()
+        self.conn.close()
+        self.root.destroy()
+
+    def _run_db(self, fn, *args, callback, on_error=None):
+        on_error = on_error or self._on_db_error
+        future = self._db_executor.submit(fn, self._worker_conn, *args)
+        future.add_done_callback(lambda f: self._db_results.put((f, callback, on_error)))
+        self._db_pending += 1
+        if not self._db_polling:
+            self._db_polling = True
+            self.root.after(DB_POLL_MS, self._drain_db_results)
+
+    def _write_db(self, sql, params, *callbacks, description, on_saved=None, on_failed=None):
+        # Writes arriving within WRITE_BATCH_MS are committed together on the DB worker; callbacks run afterwards.
+        if not self._pending_writes:
+            self.root.after(WRITE_BATCH_MS, self._flush_writes)
+        self._pending_writes.append((sql, params, description, on_saved, on_failed))
+        self._write_callbacks.update(dict.fromkeys(callbacks))
+
+    def _flush_writes(self):
+        writes, callbacks = self._pending_writes, list(self._write_callbacks)
+        if not writes:
+            return
+        self._pending_writes, self._write_callbacks = [], {}
+
+        def done(failed):
+            errors = dict(failed)
+            for index, (_sql, _params, _description, on_saved, on_failed) in enumerate(writes):
+                callback = on_failed if index in errors else on_saved
+                if callback:
+                    callback()
+            if len(errors) < len(writes):
+                for callback in callbacks:
+                    callback()
+            if errors:
+                self._on_write_error([(writes[index][2], exc) for index, exc in errors.items()])
+
+        def batch_failed(exc):
+            for _sql, _params, _description, _on_saved, on_failed in writes:
+                if on_failed:
+                    on_failed()
+            self._on_write_error([(write[2], exc) for write in writes])
+
+        self._run_db(
+            write_batch,
+            [(write[0], write[1]) for write in writes],
+            callback=done,
+            on_error=batch_failed,
+        )
+
+    def _drain_db_results(self):
+        # Tk is not thread-safe, so finished jobs are handed back here and their callbacks run on the Tk thread.
+        try:
+            while True:
+                try:
+                    future, callback, on_error = self._db_results.get_nowait()
+                except queue.Empty:
+                    break
+                self._db_pending -= 1
+                exc = future.exception()
+                if exc is not None:
+                    on_error(exc)
+                else:
+                    callback(future.result())
+        finally:
+            self._db_polling = self._db_pending > 0
+            if self._db_polling:
+                self.root.after(DB_POLL_MS, self._drain_db_results)
+
+    def _on_db_error(self, exc, action="Database operation"):
+        self.status_var.set(f"{action} failed")
+        messagebox.showerror(f"{action} failed", str(exc))
+
+    def _on_write_error(self, failures):
+        self.status_var.set("Not saved: " + ", ".join(description for description, _exc in failures))
+        messagebox.showerror(
+            "Save failed",
+            "\n".join(f"{description.capitalize()}: {exc}" for description, exc in failures),
+        )
+
     def _setup_style(self):
-<<<<<<< HEAD
         self.root.configure(bg=COLORS["background"])
         style = ttk.Style(self.root)
         style.theme_use("clam")
@@ -230,36 +484,12 @@ class SpaceApp:
     def _build_ui(self):
         header = ttk.Frame(self.root, padding=(16, 12))
         header.pack(fill="x")
-=======
-        self.root.configure(bg="#0B0B2A")
-        style = ttk.Style(self.root)
-        style.theme_use("clam")
-        style.configure("TFrame", background="#0B0B2A")
-        style.configure("TLabel", background="#0B0B2A", foreground="#FFD700")
-        style.configure("Header.TLabel", font=("Segoe UI", 14, "bold"))
-        style.configure("Status.TLabel", background="#101038", foreground="#FFD700")
-        style.configure("TButton", background="#1C1C3A", foreground="#FFD700")
-        style.map("TButton", background=[("active", "#2A2A5A")])
-        style.configure("Treeview", background="#0F0F33", foreground="#FFD700", fieldbackground="#0F0F33")
-        style.map("Treeview", background=[("selected", "#2A2A5A")])
-        style.configure("TNotebook", background="#0B0B2A")
-        style.configure("TNotebook.Tab", background="#1C1C3A", foreground="#FFD700")
-        style.map("TNotebook.Tab", background=[("selected", "#2A2A5A")])
-
-    def _build_ui(self):
-        header = ttk.Frame(self.root)
-        header.pack(fill="x", padx=16, pady=12)
->>>>>>> main
 
         ttk.Label(header, text="Space Venue Control Center", style="Header.TLabel").pack(side="left")
         ttk.Label(header, textvariable=self.status_var, style="Status.TLabel").pack(side="right")
 
         notebook = ttk.Notebook(self.root)
-<<<<<<< HEAD
         notebook.pack(fill="both", expand=True, padx=16, pady=12)
-=======
-        notebook.pack(fill="both", expand=True, padx=12, pady=8)
->>>>>>> main
 
         self.dashboard_tab = ttk.Frame(notebook)
         self.items_tab = ttk.Frame(notebook)
@@ -273,125 +503,106 @@ class SpaceApp:
         notebook.add(self.reports_tab, text="Reports")
         notebook.add(self.settings_tab, text="Settings")
 
+        # Only the dashboard is built up front; the other tabs are built the first time they are shown.
         self._build_dashboard()
-        self._build_items()
-        self._build_cash()
-        self._build_reports()
-        self._build_settings()
+        self._tab_builders = {
+            str(self.items_tab): self._build_items,
+            str(self.cash_tab): self._build_cash,
+            str(self.reports_tab): self._build_reports,
+            str(self.settings_tab): self._build_settings,
+        }
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        builder = self._tab_builders.pop(event.widget.select(), None)
+        if builder:
+            builder()
 
     def _build_dashboard(self):
-<<<<<<< HEAD
         ttk.Label(self.dashboard_tab, text="Live Stations", style="Header.TLabel").pack(anchor="w", pady=8, padx=16)
         container = ttk.Frame(self.dashboard_tab, padding=(8, 4))
         container.pack(fill="both", expand=True, padx=12, pady=8)
 
-        for station in STATIONS:
-            frame = ttk.Frame(container, padding=16, style="Card.TFrame")
-            frame.pack(fill="x", pady=10)
-=======
-        ttk.Label(self.dashboard_tab, text="Live Stations", style="Header.TLabel").pack(anchor="w", pady=8, padx=12)
-        container = ttk.Frame(self.dashboard_tab)
-        container.pack(fill="both", expand=True, padx=12)
+        columns = ("name", "rate", "customer", "state", "timer", "cost")
+        headings = ("Station", "Rate (EGP/hr)", "Customer", "State", "Timer", "Cost")
+        self.stations_tree = ttk.Treeview(
+            container, columns=columns, show="headings", height=len(STATIONS), selectmode="browse"
+        )
+        for col, label in zip(columns, headings):
+            self.stations_tree.heading(col, text=label)
+        self.stations_tree.column("name", width=160)
+        self.stations_tree.column("rate", width=120, anchor="e")
+        self.stations_tree.column("customer", width=200)
+        self.stations_tree.column("state", width=100)
+        self.stations_tree.column("timer", width=110, anchor="e")
+        self.stations_tree.column("cost", width=120, anchor="e")
+        for state_text, colour in STATE_COLORS.items():
+            self.stations_tree.tag_configure(state_text, foreground=colour)
+        self.stations_tree.pack(fill="x")
 
         for station in STATIONS:
-            frame = ttk.Frame(container, padding=12)
-            frame.pack(fill="x", pady=6)
->>>>>>> main
-
             state = StationState(station, self._update_dashboard)
-            self.station_states[station["name"]] = state
-
-<<<<<<< HEAD
-            name_label = ttk.Label(frame, text=station["name"], font=("Segoe UI", 12, "bold"), style="Card.TLabel")
-            name_label.grid(row=0, column=0, sticky="w", padx=(0, 8), pady=(0, 6))
-=======
-            name_label = ttk.Label(frame, text=station["name"], font=("Segoe UI", 12, "bold"))
-            name_label.grid(row=0, column=0, sticky="w")
->>>>>>> main
-
-            rate_var = tk.DoubleVar(value=station["rate_per_hour"])
-            station["rate_var"] = rate_var
-
-<<<<<<< HEAD
-            ttk.Label(frame, text="Rate (EGP/hr)", style="Card.TLabel").grid(row=0, column=1, padx=8, pady=(0, 6))
-            rate_entry = ttk.Entry(frame, textvariable=rate_var, width=10)
-            rate_entry.grid(row=0, column=2, padx=6, pady=(0, 6))
-
-            ttk.Label(frame, text="Customer", style="Card.TLabel").grid(row=0, column=3, padx=8, pady=(0, 6))
-            customer_var = tk.StringVar()
-            station["customer_var"] = customer_var
-            customer_entry = ttk.Entry(frame, textvariable=customer_var, width=20)
-            customer_entry.grid(row=0, column=4, padx=6, pady=(0, 6))
-
-            state_label = ttk.Label(
-                frame,
-                text="Stopped",
-                foreground=COLORS["accent_red"],
-                style="Card.TLabel",
-            )
-            state_label.grid(row=0, column=5, padx=12, pady=(0, 6))
-            station["state_label"] = state_label
-
-            timer_label = ttk.Label(frame, text="00:00:00", font=("Segoe UI", 12, "bold"), style="Card.TLabel")
-            timer_label.grid(row=1, column=0, sticky="w", padx=(0, 8))
-            station["timer_label"] = timer_label
-
-            cost_label = ttk.Label(frame, text="EGP 0.00", style="Card.TLabel")
-            cost_label.grid(row=1, column=1, sticky="w", padx=(0, 8))
-            station["cost_label"] = cost_label
-
-            controls = ttk.Frame(frame, style="Card.TFrame")
-            controls.grid(row=1, column=3, columnspan=3, sticky="e", pady=(4, 0))
-            start_btn = ttk.Button(controls, text="▶ Start", command=lambda s=state: self._start_station(s))
-            pause_btn = ttk.Button(controls, text="⏸ Pause", command=lambda s=state: self._pause_station(s))
-            stop_btn = ttk.Button(controls, text="⏹ Stop", command=lambda s=state: self._stop_station(s))
-            reset_btn = ttk.Button(controls, text="⟲ Reset", command=lambda s=state: self._reset_station(s))
-            for btn in (start_btn, pause_btn, stop_btn, reset_btn):
-                btn.pack(side="left", padx=6)
-            ToolTip(start_btn, "Start session timer")
-            ToolTip(pause_btn, "Pause or resume session")
-            ToolTip(stop_btn, "Stop session and save")
-            ToolTip(reset_btn, "Clear timer and customer info")
-=======
-            ttk.Label(frame, text="Rate (EGP/hr)").grid(row=0, column=1, padx=8)
-            rate_entry = ttk.Entry(frame, textvariable=rate_var, width=10)
-            rate_entry.grid(row=0, column=2, padx=4)
-
-            ttk.Label(frame, text="Customer").grid(row=0, column=3, padx=8)
-            customer_var = tk.StringVar()
-            station["customer_var"] = customer_var
-            customer_entry = ttk.Entry(frame, textvariable=customer_var, width=20)
-            customer_entry.grid(row=0, column=4)
-
-            state_label = ttk.Label(frame, text="Stopped", foreground="#ff5f5f")
-            state_label.grid(row=0, column=5, padx=10)
-            station["state_label"] = state_label
-
-            timer_label = ttk.Label(frame, text="00:00:00", font=("Segoe UI", 12, "bold"))
-            timer_label.grid(row=1, column=0, sticky="w")
-            station["timer_label"] = timer_label
-
-            cost_label = ttk.Label(frame, text="EGP 0.00")
-            cost_label.grid(row=1, column=1, sticky="w")
-            station["cost_label"] = cost_label
-
-            controls = ttk.Frame(frame)
-            controls.grid(row=1, column=3, columnspan=3, sticky="e")
-            ttk.Button(controls, text="Start", command=lambda s=state: self._start_station(s)).pack(side="left", padx=4)
-            ttk.Button(controls, text="Pause", command=lambda s=state: self._pause_station(s)).pack(side="left", padx=4)
-            ttk.Button(controls, text="Stop", command=lambda s=state: self._stop_station(s)).pack(side="left", padx=4)
-            ttk.Button(controls, text="Reset", command=lambda s=state: self._reset_station(s)).pack(side="left", padx=4)
->>>>>>> main
-
-        for i in range(6):
-            container.columnconfigure(i, weight=1)
+            self.station_states[station.name] = state
+            station.rate_var = tk.StringVar(value=str(station.rate_per_hour))
+            station.customer_var = tk.StringVar()
+            self.stations_tree.insert("", "end", iid=station.name, values=(station.name,), tags=("Stopped",))
+            self._dash.append((state, station))
+
+        # One control bar drives whichever station is selected in the tree.
+        controls = ttk.Frame(container, padding=16, style="Card.TFrame")
+        controls.pack(fill="x", pady=10)
+        self.selected_station_label = ttk.Label(controls, font=("Segoe UI", 12, "bold"), style="Card.TLabel")
+        self.selected_station_label.grid(row=0, column=0, sticky="w", padx=(0, 8))
+
+        ttk.Label(controls, text="Rate (EGP/hr)", style="Card.TLabel").grid(row=0, column=1, padx=8)
+        self.rate_entry = ttk.Entry(controls, width=10)
+        self.rate_entry.grid(row=0, column=2, padx=6)
+        self.rate_entry.bind("<FocusOut>", self._on_rate_entered)
+        self.rate_entry.bind("<Return>", self._on_rate_entered)
+
+        ttk.Label(controls, text="Customer", style="Card.TLabel").grid(row=0, column=3, padx=8)
+        self.customer_entry = ttk.Entry(controls, width=20)
+        self.customer_entry.grid(row=0, column=4, padx=6)
+
+        buttons = ttk.Frame(controls, style="Card.TFrame")
+        buttons.grid(row=0, column=5, sticky="e", padx=(12, 0))
+        start_btn = ttk.Button(buttons, text="▶ Start", command=lambda: self._start_station(self._selected_state()))
+        pause_btn = ttk.Button(buttons, text="⏸ Pause", command=lambda: self._pause_station(self._selected_state()))
+        stop_btn = ttk.Button(buttons, text="⏹ Stop", command=lambda: self._stop_station(self._selected_state()))
+        reset_btn = ttk.Button(buttons, text="⟲ Reset", command=lambda: self._reset_station(self._selected_state()))
+        for btn in (start_btn, pause_btn, stop_btn, reset_btn):
+            btn.pack(side="left", padx=6)
+        ToolTip(start_btn, "Start session timer")
+        ToolTip(pause_btn, "Pause or resume session")
+        ToolTip(stop_btn, "Stop session and save")
+        ToolTip(reset_btn, "Clear timer and customer info")
+        controls.columnconfigure(5, weight=1)
+
+        self.stations_tree.bind("<<TreeviewSelect>>", self._on_station_select)
+        self.stations_tree.selection_set(STATIONS[0].name)
+        self._on_station_select()
+
+    def _selected_state(self):
+        selection = self.stations_tree.selection()
+        return self.station_states[selection[0] if selection else STATIONS[0].name]
+
+    def _on_station_select(self, _event=None):
+        if self._selected_station is not None and self._commit_rate(self._selected_station):
+            self._update_dashboard()
+        station = self._selected_state().station
+        self._selected_station = station
+        self.selected_station_label.configure(text=station.name)
+        self.rate_entry.configure(textvariable=station.rate_var)
+        self.customer_entry.configure(textvariable=station.customer_var)
 
     def _build_items(self):
-<<<<<<< HEAD
         header = ttk.Frame(self.items_tab, padding=(12, 8))
         header.pack(fill="x")
         ttk.Label(header, text="Custom Items", style="Header.TLabel").pack(side="left")
         ttk.Button(header, text="Add Item", command=self._add_item).pack(side="right")
+        import_btn = ttk.Button(header, text="Import CSV", command=self._import_items)
+        import_btn.pack(side="right", padx=6)
+        ToolTip(import_btn, "Add items from a CSV file of name, price rows")
 
         filter_row = ttk.Frame(self.items_tab, padding=(12, 4))
         filter_row.pack(fill="x")
@@ -399,11 +610,18 @@ class SpaceApp:
         self.item_search = tk.StringVar()
         search_entry = ttk.Entry(filter_row, textvariable=self.item_search, width=24)
         search_entry.pack(side="left", padx=6)
-        search_entry.bind("<KeyRelease>", lambda _event: self._refresh_items())
+        search_entry.bind("<KeyRelease>", self._on_item_search)
 
         tree_frame = ttk.Frame(self.items_tab, padding=(12, 4))
         tree_frame.pack(fill="both", expand=True)
-        self.items_tree = ttk.Treeview(tree_frame, columns=("name", "price"), show="headings", height=10)
+        self.items_tree = ttk.Treeview(
+            tree_frame,
+            columns=("name", "price", "price_raw"),
+            displaycolumns=("name", "price"),
+            show="headings",
+            height=10,
+        )
+        self.items_tree._numeric_cols = {"price"}
         self.items_tree.heading("name", text="Item", command=lambda: self._sort_tree(self.items_tree, "name"))
         self.items_tree.heading("price", text="Price (EGP)", command=lambda: self._sort_tree(self.items_tree, "price"))
         self.items_tree.column("name", width=240)
@@ -424,6 +642,7 @@ class SpaceApp:
         ToolTip(edit_btn, "Edit selected item")
         ToolTip(delete_btn, "Delete selected item")
         ToolTip(sell_btn, "Record a sale for selected item")
+        self._refresh_items()
 
     def _build_cash(self):
         header = ttk.Frame(self.cash_tab, padding=(12, 8))
@@ -440,16 +659,17 @@ class SpaceApp:
         )
 
         ttk.Label(form, text="Amount (EGP)").grid(row=0, column=2, padx=6, sticky="e")
-        self.cash_amount = tk.DoubleVar(value=0.0)
-        ttk.Entry(form, textvariable=self.cash_amount, width=12).grid(row=0, column=3, padx=6)
+        self.cash_amount_entry = ttk.Entry(form, width=12)
+        self.cash_amount_entry.insert(0, "0")
+        self.cash_amount_entry.grid(row=0, column=3, padx=6)
 
         ttk.Label(form, text="Notes").grid(row=0, column=4, padx=6, sticky="e")
-        self.cash_notes = tk.StringVar()
-        ttk.Entry(form, textvariable=self.cash_notes, width=30).grid(row=0, column=5, padx=6)
+        self.cash_notes_entry = ttk.Entry(form, width=30)
+        self.cash_notes_entry.grid(row=0, column=5, padx=6)
 
-        add_btn = ttk.Button(form, text="Add", command=self._add_cash)
-        add_btn.grid(row=0, column=6, padx=8)
-        ToolTip(add_btn, "Record a cash deposit or withdrawal")
+        self.cash_add_btn = ttk.Button(form, text="Add", command=self._add_cash)
+        self.cash_add_btn.grid(row=0, column=6, padx=8)
+        ToolTip(self.cash_add_btn, "Record a cash deposit or withdrawal")
 
         filter_row = ttk.Frame(self.cash_tab, padding=(12, 4))
         filter_row.pack(fill="x")
@@ -457,11 +677,17 @@ class SpaceApp:
         self.cash_search = tk.StringVar()
         cash_entry = ttk.Entry(filter_row, textvariable=self.cash_search, width=24)
         cash_entry.pack(side="left", padx=6)
-        cash_entry.bind("<KeyRelease>", lambda _event: self._refresh_cash())
+        cash_entry.bind("<KeyRelease>", self._on_cash_search)
 
         cash_frame = ttk.Frame(self.cash_tab, padding=(12, 4))
         cash_frame.pack(fill="both", expand=True)
-        self.cash_tree = ttk.Treeview(cash_frame, columns=("type", "amount", "notes", "ts"), show="headings")
+        self.cash_tree = ttk.Treeview(
+            cash_frame,
+            columns=("type", "amount", "notes", "ts", "amount_raw"),
+            displaycolumns=("type", "amount", "notes", "ts"),
+            show="headings",
+        )
+        self.cash_tree._numeric_cols = {"amount"}
         for col, label in zip(("type", "amount", "notes", "ts"), ("Type", "Amount", "Notes", "Time")):
             self.cash_tree.heading(col, text=label, command=lambda c=col: self._sort_tree(self.cash_tree, c))
         self.cash_tree.column("type", width=100)
@@ -472,65 +698,16 @@ class SpaceApp:
         self.cash_tree.configure(yscrollcommand=cash_scroll.set)
         self.cash_tree.pack(side="left", fill="both", expand=True)
         cash_scroll.pack(side="right", fill="y")
+        self._refresh_cash()
 
     def _build_reports(self):
         header = ttk.Frame(self.reports_tab, padding=(12, 8))
         header.pack(fill="x")
-=======
-        header = ttk.Frame(self.items_tab)
-        header.pack(fill="x", padx=12, pady=8)
-        ttk.Label(header, text="Custom Items", style="Header.TLabel").pack(side="left")
-        ttk.Button(header, text="Add Item", command=self._add_item).pack(side="right")
-
-        self.items_tree = ttk.Treeview(self.items_tab, columns=("price"), show="headings", height=10)
-        self.items_tree.heading("price", text="Price (EGP)")
-        self.items_tree.pack(fill="both", expand=True, padx=12)
-
-        controls = ttk.Frame(self.items_tab)
-        controls.pack(fill="x", padx=12, pady=8)
-        ttk.Button(controls, text="Edit", command=self._edit_item).pack(side="left")
-        ttk.Button(controls, text="Delete", command=self._delete_item).pack(side="left", padx=6)
-        ttk.Button(controls, text="Sell", command=self._sell_item).pack(side="left", padx=6)
-
-    def _build_cash(self):
-        header = ttk.Frame(self.cash_tab)
-        header.pack(fill="x", padx=12, pady=8)
-        ttk.Label(header, text="Cash Register", style="Header.TLabel").pack(side="left")
-
-        form = ttk.Frame(self.cash_tab)
-        form.pack(fill="x", padx=12, pady=6)
-
-        ttk.Label(form, text="Type").grid(row=0, column=0, padx=4, sticky="e")
-        self.cash_type = tk.StringVar(value="deposit")
-        ttk.Combobox(form, textvariable=self.cash_type, values=["deposit", "withdrawal"], width=12).grid(
-            row=0, column=1, padx=4
-        )
-
-        ttk.Label(form, text="Amount (EGP)").grid(row=0, column=2, padx=4, sticky="e")
-        self.cash_amount = tk.DoubleVar(value=0.0)
-        ttk.Entry(form, textvariable=self.cash_amount, width=12).grid(row=0, column=3, padx=4)
-
-        ttk.Label(form, text="Notes").grid(row=0, column=4, padx=4, sticky="e")
-        self.cash_notes = tk.StringVar()
-        ttk.Entry(form, textvariable=self.cash_notes, width=30).grid(row=0, column=5, padx=4)
-
-        ttk.Button(form, text="Add", command=self._add_cash).grid(row=0, column=6, padx=6)
-
-        self.cash_tree = ttk.Treeview(self.cash_tab, columns=("type", "amount", "notes", "ts"), show="headings")
-        for col, label in zip(("type", "amount", "notes", "ts"), ("Type", "Amount", "Notes", "Time")):
-            self.cash_tree.heading(col, text=label)
-        self.cash_tree.pack(fill="both", expand=True, padx=12, pady=6)
-
-    def _build_reports(self):
-        header = ttk.Frame(self.reports_tab)
-        header.pack(fill="x", padx=12, pady=8)
->>>>>>> main
         ttk.Label(header, text="Financial Reports", style="Header.TLabel").pack(side="left")
         ttk.Button(header, text="Daily Report", command=lambda: self._build_report("daily")).pack(side="right")
         ttk.Button(header, text="Monthly Report", command=lambda: self._build_report("monthly")).pack(side="right", padx=6)
         ttk.Button(header, text="Export CSV", command=self._export_report).pack(side="right", padx=6)
 
-<<<<<<< HEAD
         report_frame = ttk.Frame(self.reports_tab, padding=(12, 4))
         report_frame.pack(fill="both", expand=True)
         self.report_text = tk.Text(
@@ -547,138 +724,190 @@ class SpaceApp:
 
     def _build_settings(self):
         ttk.Label(self.settings_tab, text="Settings", style="Header.TLabel").pack(anchor="w", padx=16, pady=12)
-=======
-        self.report_text = tk.Text(self.reports_tab, height=22, bg="#0F0F33", fg="#FFD700", insertbackground="#FFD700")
-        self.report_text.pack(fill="both", expand=True, padx=12, pady=8)
-
-    def _build_settings(self):
-        ttk.Label(self.settings_tab, text="Settings", style="Header.TLabel").pack(anchor="w", padx=12, pady=8)
->>>>>>> main
         rtl_check = ttk.Checkbutton(
             self.settings_tab,
             text="Enable Arabic (RTL) numerals",
             variable=self.rtl,
             command=self._toggle_rtl,
         )
-<<<<<<< HEAD
         rtl_check.pack(anchor="w", padx=16, pady=6)
-=======
-        rtl_check.pack(anchor="w", padx=12, pady=4)
->>>>>>> main
 
     def _toggle_rtl(self):
+        self.status_var.set("Arabic numerals enabled" if self.rtl.get() else "Arabic numerals disabled")
+        if not self._rtl_refresh_pending:
+            self._rtl_refresh_pending = True
+            self.root.after(REFRESH_DEBOUNCE_MS, self._apply_rtl)
+
+    def _apply_rtl(self):
+        self._rtl_refresh_pending = False
         self._update_dashboard()
         self._refresh_items()
         self._refresh_cash()
-        self.status_var.set("Arabic numerals enabled" if self.rtl.get() else "Arabic numerals disabled")
 
-<<<<<<< HEAD
     def _sort_tree(self, tree, col):
-        data = [(tree.set(item, col), item) for item in tree.get_children("")]
-        try:
-            data.sort(key=lambda item: float(item[0].replace(",", "").replace("EGP", "").strip()))
-        except ValueError:
-            data.sort(key=lambda item: item[0].lower())
-        for index, (_value, item) in enumerate(data):
-            tree.move(item, "", index)
+        # Numeric columns sort on their hidden "<col>_raw" value instead of the formatted text.
+        if col in tree._numeric_cols:
+            raw_col = f"{col}_raw"
+            data = [(float(tree.set(item, raw_col)), item) for item in tree.get_children("")]
+        else:
+            data = [(tree.set(item, col).lower(), item) for item in tree.get_children("")]
+        data.sort(key=lambda pair: pair[0])
+        tree.set_children("", *(item for _value, item in data))
+
+    def _sync_tree(self, tree, cache, rows):
+        # cache maps each iid shown in the tree to its values; only rows that differ are touched.
+        new = dict(rows)
+        stale = [iid for iid in cache if iid not in new]
+        if stale:
+            tree.delete(*stale)
+        for iid, values in rows:
+            old = cache.get(iid)
+            if old is None:
+                tree.insert("", "end", iid=iid, values=values)
+            elif old != values:
+                tree.item(iid, values=values)
+        order = tuple(new)
+        if tree.get_children() != order:
+            tree.set_children("", *order)
+        return new
 
-=======
->>>>>>> main
     def _update_dashboard(self):
-        for station in STATIONS:
-            state = self.station_states[station["name"]]
-            station["customer_var"].set(station["customer_var"].get())
+        rtl = self.rtl.get()
+        tree = self.stations_tree
+        for state, station in self._dash:
             elapsed = state.current_elapsed()
-            timer_text = time.strftime("%H:%M:%S", time.gmtime(elapsed))
-            cost = (elapsed / 3600) * station["rate_var"].get()
-            station["timer_label"].configure(text=timer_text)
-            station["cost_label"].configure(text=format_currency(cost, self.rtl.get()))
             if state.running:
-                if state.paused:
-<<<<<<< HEAD
-                    station["state_label"].configure(text="Paused", foreground=COLORS["accent_yellow"])
-                else:
-                    station["state_label"].configure(text="Active", foreground=COLORS["accent_green"])
+                state_text = "Paused" if state.paused else "Active"
             else:
-                station["state_label"].configure(text="Stopped", foreground=COLORS["accent_red"])
-=======
-                    station["state_label"].configure(text="Paused", foreground="#f6c90e")
-                else:
-                    station["state_label"].configure(text="Active", foreground="#7CFF8A")
-            else:
-                station["state_label"].configure(text="Stopped", foreground="#ff5f5f")
->>>>>>> main
+                state_text = "Stopped"
+            values = (
+                station.name,
+                format_cents(round(station.rate_per_hour * 100), rtl),
+                state.customer_name,
+                state_text,
+                format_duration(elapsed),
+                format_cents(round(elapsed * station.rate_per_sec * 100), rtl),
+            )
+            # One Tcl call per station, and only when something visible changed.
+            if values != station.last_values:
+                tree.item(station.name, values=values, tags=(state_text,))
+                station.last_values = values
 
     def _schedule_tick(self):
         self._update_dashboard()
-        self.root.after(1000, self._schedule_tick)
+        # Idle stations don't change, so only keep ticking while one is running.
+        self._tick_armed = any(s.running and not s.paused for s in self.station_states.values())
+        if self._tick_armed:
+            self.root.after(1000, self._schedule_tick)
+
+    def _arm_tick(self):
+        if not self._tick_armed:
+            self._tick_armed = True
+            self.root.after(1000, self._schedule_tick)
 
     def _start_station(self, state):
-        state.customer_name = state.station["customer_var"].get()
+        self._commit_rate(state.station)
+        state.customer_name = state.station.customer_var.get()
         state.start()
-        self.status_var.set(f"Started {state.station['name']}")
+        self._arm_tick()
+        self.status_var.set(f"Started {state.station.name}")
 
     def _pause_station(self, state):
         state.pause()
-        self.status_var.set(f"Paused {state.station['name']}")
+        if state.running and not state.paused:
+            self._arm_tick()
+        self.status_var.set(f"Paused {state.station.name}")
 
     def _stop_station(self, state):
         if not state.running:
             return
+        self._commit_rate(state.station)
         state.stop()
         elapsed = state.current_elapsed()
-        cost = (elapsed / 3600) * state.station["rate_var"].get()
-        self._save_session(state.station["name"], state.customer_name, elapsed, state.station["rate_var"].get(), cost)
-        self.status_var.set(f"Stopped {state.station['name']} | {format_currency(cost, self.rtl.get())}")
+        rate = state.station.rate_per_hour
+        cost = elapsed * state.station.rate_per_sec
+        summary = f"{state.station.name} | {format_currency(cost, self.rtl.get())}"
+        self._save_session(
+            state.station.name,
+            state.customer_name,
+            state.started_at,
+            elapsed,
+            rate,
+            cost,
+            on_saved=lambda: self.status_var.set(f"Stopped {summary}"),
+        )
+
+    def _on_rate_entered(self, _event=None):
+        if self._selected_station is not None and self._commit_rate(self._selected_station):
+            self._update_dashboard()
+
+    def _commit_rate(self, station):
+        # The rate entry is only parsed when editing finishes, so the tick never reads it through Tcl.
+        try:
+            rate = float(station.rate_var.get())
+        except ValueError:
+            rate = None
+        if rate is None or not (math.isfinite(rate) and rate >= 0):
+            station.rate_var.set(str(station.rate_per_hour))
+            return False
+        if rate == station.rate_per_hour:
+            return False
+        station.rate_per_hour = rate
+        station.rate_per_sec = rate / 3600
+        return True
 
     def _reset_station(self, state):
         state.reset()
-        self.status_var.set(f"Reset {state.station['name']}")
-
-    def _save_session(self, station_name, customer_name, elapsed, rate, cost):
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.execute(
-                """
-                INSERT INTO sessions (station_name, customer_name, start_ts, end_ts, duration_seconds, rate_per_hour, cost)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    station_name,
-                    customer_name,
-                    now_iso(),
-                    now_iso(),
-                    int(elapsed),
-                    rate,
-                    cost,
-                ),
-            )
-        self._refresh_reports_if_visible()
+        self.status_var.set(f"Reset {state.station.name}")
+
+    def _save_session(self, station_name, customer_name, started_at, elapsed, rate, cost, on_saved=None):
+        self._write_db(
+            INSERT_SESSION_SQL,
+            (
+                station_name,
+                customer_name,
+                started_at,
+                now_iso(),
+                int(elapsed),
+                rate,
+                cost,
+            ),
+            self._refresh_reports_if_visible,
+            description=f"session for {station_name} ({format_currency(cost)})",
+            on_saved=on_saved,
+        )
 
     def _refresh_reports_if_visible(self):
-        if self.report_text.get("1.0", tk.END).strip():
+        # Coalesce bursts of writes (e.g. several stations stopped at closing) into one report rebuild.
+        if not self._report_refresh_pending:
+            self._report_refresh_pending = True
+            self.root.after(REFRESH_DEBOUNCE_MS, self._refresh_reports)
+
+    def _refresh_reports(self):
+        self._report_refresh_pending = False
+        if hasattr(self, "report_text") and self.report_text.get("1.0", tk.END).strip():
             self._build_report("daily")
 
     def _refresh_items(self):
-        for row in self.items_tree.get_children():
-            self.items_tree.delete(row)
-        with sqlite3.connect(DB_PATH) as conn:
-<<<<<<< HEAD
-            query = "SELECT id, name, price FROM items ORDER BY name"
-            rows = conn.execute(query).fetchall()
-            search_term = self.item_search.get().strip().lower() if hasattr(self, "item_search") else ""
-            for item_id, name, price in rows:
-                if search_term and search_term not in name.lower():
-                    continue
-                price_text = format_currency(price, self.rtl.get())
-                self.items_tree.insert("", "end", iid=str(item_id), values=(name, price_text))
-=======
-            for item_id, name, price in conn.execute("SELECT id, name, price FROM items ORDER BY name"):
-                label = f"{name}"
-                price_text = format_currency(price, self.rtl.get())
-                self.items_tree.insert("", "end", iid=str(item_id), values=(price_text,), text=label)
-        self.items_tree.configure(displaycolumns=("price",))
-        self.items_tree["show"] = "headings"
->>>>>>> main
+        if not hasattr(self, "items_tree"):
+            return
+        search_term = self.item_search.get().strip().lower()
+        self._run_db(
+            fetch_items,
+            search_term,
+            callback=self._show_items,
+            on_error=lambda exc: self._on_db_error(exc, "Loading items"),
+        )
+
+    def _show_items(self, rows):
+        rtl = self.rtl.get()
+        new_rows = [(str(item_id), (name, format_currency(price, rtl), price)) for item_id, name, price in rows]
+        self._items_cache = self._sync_tree(self.items_tree, self._items_cache, new_rows)
+
+    def _on_item_search(self, _event=None):
+        if self._item_search_after:
+            self.root.after_cancel(self._item_search_after)
+        self._item_search_after = self.root.after(SEARCH_DEBOUNCE_MS, self._refresh_items)
 
     def _add_item(self):
         ItemDialog(self.root, "Add Item", self._save_new_item)
@@ -689,8 +918,7 @@ class SpaceApp:
             messagebox.showwarning("Select item", "Please select an item to edit.")
             return
         item_id = int(selection[0])
-        with sqlite3.connect(DB_PATH) as conn:
-            row = conn.execute("SELECT name, price FROM items WHERE id = ?", (item_id,)).fetchone()
+        row = self.conn.execute(SELECT_ITEM_SQL, (item_id,)).fetchone()
         if not row:
             return
         ItemDialog(self.root, "Edit Item", lambda n, p: self._update_item(item_id, n, p), row)
@@ -703,18 +931,46 @@ class SpaceApp:
         item_id = int(selection[0])
         if not messagebox.askyesno("Confirm", "Delete selected item?"):
             return
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+        self.conn.execute(DELETE_ITEM_SQL, (item_id,))
+        self.conn.commit()
         self._refresh_items()
 
     def _save_new_item(self, name, price):
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.execute("INSERT INTO items (name, price) VALUES (?, ?)", (name, price))
+        self.conn.execute(INSERT_ITEM_SQL, (name, price))
+        self.conn.commit()
         self._refresh_items()
 
+    def _import_items(self):
+        path = filedialog.askopenfilename(filetypes=[("CSV", "*.csv")])
+        if not path:
+            return
+        rows = []
+        try:
+            # utf-8-sig drops the byte-order mark Excel writes at the start of UTF-8 CSV files.
+            with open(path, newline="", encoding="utf-8-sig") as csvfile:
+                for record in csv.reader(csvfile):
+                    if len(record) < 2 or not record[0].strip():
+                        continue
+                    try:
+                        price = float(record[1])
+                    except ValueError:
+                        continue
+                    if price > 0:
+                        rows.append((record[0].strip(), price))
+        except (OSError, UnicodeDecodeError) as exc:
+            messagebox.showwarning("Import failed", f"Could not read {path} as a UTF-8 CSV file.\n\n{exc}")
+            return
+        self._bulk_insert(INSERT_ITEM_SQL, rows)
+        self._refresh_items()
+        self.status_var.set(f"Imported {len(rows)} items")
+
+    def _bulk_insert(self, sql, rows):
+        with self.conn:
+            self.conn.executemany(sql, rows)
+
     def _update_item(self, item_id, name, price):
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.execute("UPDATE items SET name = ?, price = ? WHERE id = ?", (name, price, item_id))
+        self.conn.execute(UPDATE_ITEM_SQL, (name, price, item_id))
+        self.conn.commit()
         self._refresh_items()
 
     def _sell_item(self):
@@ -723,58 +979,72 @@ class SpaceApp:
             messagebox.showwarning("Select item", "Please select an item to sell.")
             return
         item_id = int(selection[0])
-        with sqlite3.connect(DB_PATH) as conn:
-            row = conn.execute("SELECT name, price FROM items WHERE id = ?", (item_id,)).fetchone()
+        row = self.conn.execute(SELECT_ITEM_SQL, (item_id,)).fetchone()
         if not row:
             return
         SaleDialog(self.root, row[0], row[1], lambda qty: self._record_sale(item_id, row[1], qty))
 
     def _record_sale(self, item_id, price, qty):
         total = price * qty
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.execute(
-                "INSERT INTO item_sales (ts, item_id, qty, total) VALUES (?, ?, ?, ?)",
-                (now_iso(), item_id, qty, total),
-            )
-        self.status_var.set(f"Sale recorded: {format_currency(total, self.rtl.get())}")
-        self._refresh_reports_if_visible()
+        amount = format_currency(total, self.rtl.get())
+        self._write_db(
+            INSERT_SALE_SQL,
+            (now_iso(), item_id, qty, total),
+            self._refresh_reports_if_visible,
+            description=f"sale ({amount})",
+            on_saved=lambda: self.status_var.set(f"Sale recorded: {amount}"),
+        )
 
     def _add_cash(self):
-        amount = self.cash_amount.get()
+        try:
+            amount = float(self.cash_amount_entry.get())
+        except ValueError:
+            amount = 0
         if amount <= 0:
             messagebox.showwarning("Invalid amount", "Amount must be greater than zero.")
             return
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.execute(
-                "INSERT INTO cash_transactions (ts, type, amount, notes) VALUES (?, ?, ?, ?)",
-                (now_iso(), self.cash_type.get(), amount, self.cash_notes.get()),
-            )
-        self.cash_amount.set(0.0)
-        self.cash_notes.set("")
-        self._refresh_cash()
-        self._refresh_reports_if_visible()
+        cash_type = self.cash_type.get()
+        # Add stays disabled until the entry is committed, so a repeated click cannot queue it twice.
+        self.cash_add_btn.state(["disabled"])
+        self._write_db(
+            INSERT_CASH_SQL,
+            (now_iso(), cash_type, amount, self.cash_notes_entry.get()),
+            self._refresh_cash,
+            self._refresh_reports_if_visible,
+            description=f"{cash_type} entry ({format_currency(amount)})",
+            on_saved=self._on_cash_saved,
+            on_failed=lambda: self.cash_add_btn.state(["!disabled"]),
+        )
+
+    def _on_cash_saved(self):
+        self.cash_amount_entry.delete(0, tk.END)
+        self.cash_amount_entry.insert(0, "0")
+        self.cash_notes_entry.delete(0, tk.END)
+        self.cash_add_btn.state(["!disabled"])
+
+    def _on_cash_search(self, _event=None):
+        if self._cash_search_after:
+            self.root.after_cancel(self._cash_search_after)
+        self._cash_search_after = self.root.after(SEARCH_DEBOUNCE_MS, self._refresh_cash)
 
     def _refresh_cash(self):
-        for row in self.cash_tree.get_children():
-            self.cash_tree.delete(row)
-        with sqlite3.connect(DB_PATH) as conn:
-<<<<<<< HEAD
-            rows = conn.execute(
-                "SELECT id, type, amount, notes, ts FROM cash_transactions ORDER BY ts DESC"
-            ).fetchall()
-            search_term = self.cash_search.get().strip().lower() if hasattr(self, "cash_search") else ""
-            for tx_id, tx_type, amount, notes, ts in rows:
-                searchable = f"{tx_type} {notes or ''} {ts}".lower()
-                if search_term and search_term not in searchable:
-                    continue
-=======
-            for tx_id, tx_type, amount, notes, ts in conn.execute(
-                "SELECT id, type, amount, notes, ts FROM cash_transactions ORDER BY ts DESC"
-            ):
->>>>>>> main
-                self.cash_tree.insert(
-                    "", "end", iid=str(tx_id), values=(tx_type, format_currency(amount, self.rtl.get()), notes, ts)
-                )
+        if not hasattr(self, "cash_tree"):
+            return
+        search_term = self.cash_search.get().strip().lower()
+        self._run_db(
+            fetch_cash,
+            search_term,
+            callback=self._show_cash,
+            on_error=lambda exc: self._on_db_error(exc, "Loading cash entries"),
+        )
+
+    def _show_cash(self, rows):
+        rtl = self.rtl.get()
+        new_rows = [
+            (str(tx_id), (tx_type, format_currency(amount, rtl), notes, ts, amount))
+            for tx_id, tx_type, amount, notes, ts in rows
+        ]
+        self._cash_cache = self._sync_tree(self.cash_tree, self._cash_cache, new_rows)
 
     def _build_report(self, mode):
         today = dt.date.today()
@@ -788,49 +1058,39 @@ class SpaceApp:
             end = dt.datetime(next_month.year, next_month.month, 1) - dt.timedelta(seconds=1)
             title = f"Monthly Report - {today.strftime('%B %Y')}"
 
-        with sqlite3.connect(DB_PATH) as conn:
-            sessions_total = conn.execute(
-                "SELECT COALESCE(SUM(cost), 0) FROM sessions WHERE start_ts BETWEEN ? AND ?",
-                (start.isoformat(), end.isoformat()),
-            ).fetchone()[0]
-            sales_total = conn.execute(
-                "SELECT COALESCE(SUM(total), 0) FROM item_sales WHERE ts BETWEEN ? AND ?",
-                (start.isoformat(), end.isoformat()),
-            ).fetchone()[0]
-            cash_total = conn.execute(
-                "SELECT COALESCE(SUM(CASE WHEN type = 'deposit' THEN amount ELSE -amount END), 0) FROM cash_transactions"
-                " WHERE ts BETWEEN ? AND ?",
-                (start.isoformat(), end.isoformat()),
-            ).fetchone()[0]
+        self._run_db(
+            fetch_report_totals,
+            start.isoformat(),
+            end.isoformat(),
+            callback=lambda totals: self._show_report(title, *totals),
+            on_error=lambda exc: self._on_db_error(exc, "Building report"),
+        )
 
+    def _show_report(self, title, sessions_total, sales_total, cash_total):
+        rtl = self.rtl.get()
+        lines = [
+            title,
+            "=" * 40,
+            f"Session Revenue: {format_currency(sessions_total, rtl)}",
+            f"Item Sales: {format_currency(sales_total, rtl)}",
+            f"Cash Net: {format_currency(cash_total, rtl)}",
+            "=" * 40,
+            f"Total Revenue: {format_currency(sessions_total + sales_total, rtl)}",
+        ]
         self.report_text.delete("1.0", tk.END)
-        self.report_text.insert(tk.END, f"{title}\n")
-        self.report_text.insert(tk.END, "=" * 40 + "\n")
-        self.report_text.insert(tk.END, f"Session Revenue: {format_currency(sessions_total, self.rtl.get())}\n")
-        self.report_text.insert(tk.END, f"Item Sales: {format_currency(sales_total, self.rtl.get())}\n")
-        self.report_text.insert(tk.END, f"Cash Net: {format_currency(cash_total, self.rtl.get())}\n")
-        self.report_text.insert(tk.END, "=" * 40 + "\n")
-        self.report_text.insert(
-            tk.END,
-            f"Total Revenue: {format_currency(sessions_total + sales_total, self.rtl.get())}\n",
-        )
+        self.report_text.insert(tk.END, "\n".join(lines) + "\n")
 
     def _export_report(self):
         path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV", "*.csv")])
         if not path:
             return
-        with sqlite3.connect(DB_PATH) as conn, open(path, "w", newline="") as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(["Section", "Amount (EGP)"])
-            sessions_total = conn.execute("SELECT COALESCE(SUM(cost), 0) FROM sessions").fetchone()[0]
-            sales_total = conn.execute("SELECT COALESCE(SUM(total), 0) FROM item_sales").fetchone()[0]
-            cash_total = conn.execute(
-                "SELECT COALESCE(SUM(CASE WHEN type = 'deposit' THEN amount ELSE -amount END), 0) FROM cash_transactions"
-            ).fetchone()[0]
-            writer.writerow(["Sessions", f"{sessions_total:.2f}"])
-            writer.writerow(["Item Sales", f"{sales_total:.2f}"])
-            writer.writerow(["Cash Net", f"{cash_total:.2f}"])
-        self.status_var.set(f"Report exported to {path}")
+        self.status_var.set("Exporting report...")
+        self._run_db(
+            write_export,
+            path,
+            callback=lambda done: self.status_var.set(f"Report exported to {done}"),
+            on_error=lambda exc: self._on_db_error(exc, "Export"),
+        )
 
 
 class ItemDialog(tk.Toplevel):
@@ -842,18 +1102,23 @@ class ItemDialog(tk.Toplevel):
         self.resizable(False, False)
 
         ttk.Label(self, text="Name").grid(row=0, column=0, padx=8, pady=6)
-        self.name_var = tk.StringVar(value=row[0] if row else "")
-        ttk.Entry(self, textvariable=self.name_var).grid(row=0, column=1, padx=8, pady=6)
+        self.name_entry = ttk.Entry(self)
+        self.name_entry.insert(0, row[0] if row else "")
+        self.name_entry.grid(row=0, column=1, padx=8, pady=6)
 
         ttk.Label(self, text="Price (EGP)").grid(row=1, column=0, padx=8, pady=6)
-        self.price_var = tk.DoubleVar(value=row[1] if row else 0.0)
-        ttk.Entry(self, textvariable=self.price_var).grid(row=1, column=1, padx=8, pady=6)
+        self.price_entry = ttk.Entry(self)
+        self.price_entry.insert(0, str(row[1]) if row else "0.0")
+        self.price_entry.grid(row=1, column=1, padx=8, pady=6)
 
         ttk.Button(self, text="Save", command=self._save).grid(row=2, column=0, columnspan=2, pady=10)
 
     def _save(self):
-        name = self.name_var.get().strip()
-        price = self.price_var.get()
+        name = self.name_entry.get().strip()
+        try:
+            price = float(self.price_entry.get())
+        except ValueError:
+            price = 0
         if not name or price <= 0:
             messagebox.showwarning("Invalid", "Please enter valid name and price.")
             return
@@ -873,13 +1138,17 @@ class SaleDialog(tk.Toplevel):
         ttk.Label(self, text=f"Price: EGP {price:.2f}").grid(row=1, column=0, columnspan=2, padx=8, pady=6)
 
         ttk.Label(self, text="Qty").grid(row=2, column=0, padx=8, pady=6)
-        self.qty_var = tk.IntVar(value=1)
-        ttk.Entry(self, textvariable=self.qty_var, width=6).grid(row=2, column=1, padx=8, pady=6)
+        self.qty_entry = ttk.Entry(self, width=6)
+        self.qty_entry.insert(0, "1")
+        self.qty_entry.grid(row=2, column=1, padx=8, pady=6)
 
         ttk.Button(self, text="Confirm", command=self._confirm).grid(row=3, column=0, columnspan=2, pady=10)
 
     def _confirm(self):
-        qty = self.qty_var.get()
+        try:
+            qty = int(self.qty_entry.get())
+        except ValueError:
+            qty = 0
         if qty <= 0:
             messagebox.showwarning("Invalid", "Quantity must be at least 1.")
             return